@@ -0,0 +1,41 @@
+import argparse
+import subprocess
+import tempfile
+from playwright.sync_api import sync_playwright
+
+from reddit_scraper import BROWSER_ARGS
+
+
+def main():
+    """Start a long-lived Chromium that reddit_scraper.py can attach to with --cdp-endpoint"""
+    parser = argparse.ArgumentParser(description='Launch a shared Chromium for reddit_scraper.py')
+    parser.add_argument('--port', type=int, default=9222, help='Remote debugging port (default: 9222)')
+    parser.add_argument('--headful', '--visible', dest='headless', action='store_false',
+                        help='Show the browser window')
+    args = parser.parse_args()
+    
+    # Only the executable path is needed; Chromium itself must outlive this Playwright instance
+    with sync_playwright() as playwright:
+        executable = playwright.chromium.executable_path
+    
+    command = [
+        executable,
+        f'--remote-debugging-port={args.port}',
+        f'--user-data-dir={tempfile.mkdtemp(prefix="reddit-scraper-chromium-")}',
+        *BROWSER_ARGS
+    ]
+    if args.headless:
+        command.append('--headless=new')
+    
+    process = subprocess.Popen(command)
+    print(f"Shared Chromium running (pid {process.pid})")
+    print(f"Use: python reddit_scraper.py --cdp-endpoint http://localhost:{args.port} ...")
+    
+    try:
+        process.wait()
+    except KeyboardInterrupt:
+        process.terminate()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,35 +1,360 @@
 import asyncio
 import json
 import csv
-from typing import List, Dict, Optional
+import os
+import random
+import sqlite3
+import time
+from typing import List, Dict, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+import httpx
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 import re
 
+# orjson is optional: much faster (de)serialization, with a stdlib json fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# selectolax parses server-rendered markup; without it that shortcut is skipped
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Reddit's API asks for a descriptive User-Agent on authenticated requests
+OAUTH_USER_AGENT = 'python:reddit-subreddit-scraper:1.0'
+OAUTH_TOKEN_URL = 'https://www.reddit.com/api/v1/access_token'
+OAUTH_API_BASE = 'https://oauth.reddit.com'
+
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    f'--user-agent={USER_AGENT}'
+]
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, ignoring empty or invalid values"""
+    try:
+        value = int(os.getenv(name, ''))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+# Concurrency bound (override with SCRAPE_CONCURRENCY), per-request jitter and 429 backoff
+DEFAULT_CONCURRENCY = _env_int('SCRAPE_CONCURRENCY', 8)
+MAX_JITTER_S = 0.25
+MAX_RETRIES = 3
+BACKOFF_BASE_S = 2.0
+# Upper bound on any single 429 wait, whatever Retry-After asks for
+MAX_RETRY_DELAY_S = 60.0
+
+# Each worker reuses one page across URLs and replaces it after this many navigations
+PAGE_RECYCLE_EVERY = 50
+
+# Member/contributor counts change slowly, so cached results stay valid for a week
+DEFAULT_CACHE_PATH = '.reddit_cache.sqlite'
+DEFAULT_CACHE_TTL = 86400 * 7
+
+# Paths a result can come from; cached entries are only reused by runs that use that path
+SOURCE_JSON = 'json'
+SOURCE_BROWSER = 'browser'
+
+# Columns written to CSV output
+FIELDNAMES = ['url', 'weekly_visitors', 'weekly_contributors']
+# The about.json fast path reports different metrics, so they get their own columns
+JSON_API_FIELDNAMES = FIELDNAMES + ['subscribers', 'active_now']
+
+# Slot names Reddit uses for the two metrics
+VISITOR_SLOT = 'weekly-active-users-count'
+CONTRIBUTOR_SLOT = 'weekly-contributions-count'
+
+# Keywords for weekly visitors (members, subscribers, gamblers, etc.)
+VISITOR_KEYWORDS = [
+    'weekly visitors', 'visitors', 'members', 'subscribers',
+    'gamblers', 'users', 'community members', 'joined'
+]
+
+# Keywords for weekly contributors (active, here now, online, contributors, etc.)
+CONTRIBUTOR_KEYWORDS = [
+    'weekly contributors', 'contributors', 'here now', 'online',
+    'active', 'active users', 'currently online', 'online now'
+]
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (non-ASCII kept as-is)"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(content):
+    """Parse JSON from str or bytes"""
+    if orjson:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _compile_keywords(keywords: List[str]) -> Pattern:
+    """Compile keywords into one case-insensitive alternation (longest first so phrases win)"""
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, ordered)), re.I)
+
+
+# Patterns are compiled once at import time instead of on every call
+# A number starts and ends with a digit and may contain thousands separators or a decimal
+# point ("1,234", "2.7"), matching the JS extractor; commas are stripped before returning
+_NUM_RE = re.compile(r'(\d+(?:[.,]\d+)*)\s*([KM]?)')
+_NUM_ANY = re.compile(r'\d+(?:[.,]\d+)*')
+_VISITOR_KW_RE = _compile_keywords(VISITOR_KEYWORDS)
+_CONTRIBUTOR_KW_RE = _compile_keywords(CONTRIBUTOR_KEYWORDS)
+
+# Characters around a keyword that are searched for its number
+KEYWORD_WINDOW = 64
+
+# Stealth overrides, kept as one minified constant so every context registers the same small string
+_STEALTH_JS = (
+    "Object.defineProperty(navigator,'webdriver',{get:()=>undefined});"
+    "Object.defineProperty(navigator,'plugins',{get:()=>[1,2,3,4,5]});"
+    "Object.defineProperty(navigator,'languages',{get:()=>['en-US','en']});"
+    "window.chrome={runtime:{},loadTimes:function(){},csi:function(){},app:{}};"
+)
+
+# Short, explicit timeouts so one slow subreddit can't stall its worker for long
+NAVIGATION_TIMEOUT_MS = 8000
+METRICS_WAIT_TIMEOUT_MS = 4000
+
+# Metric extractor, installed once per context via add_init_script so the page
+# only has to parse it once instead of on every evaluate call.
+# Reddit uses slot names: weekly-active-users-count and weekly-contributions-count
+_METRICS_JS = """
+(() => {
+    const METRIC_DIV = 'div.flex.flex-col.items-start.flex-grow';
+    const VISITOR_SLOT = '""" + VISITOR_SLOT + """';
+    const CONTRIBUTOR_SLOT = '""" + CONTRIBUTOR_SLOT + """';
+    // One selector for every node the extractor needs, so the DOM is walked once per call
+    const SELECTOR = `[slot="${VISITOR_SLOT}"], [slot="${CONTRIBUTOR_SLOT}"], ${METRIC_DIV}`;
+    
+    const matchNumber = (text) => {
+        const match = (text || '').match(/(\\d+(?:[.,]\\d+)?[KM]?)/);
+        return match ? match[1].replace(/,/g, '') : null;
+    };
+    
+    // faceplate-number carries the exact integer in its number attribute; the text is abbreviated
+    const fromFaceplate = (faceplate) => {
+        const number = faceplate.getAttribute('number') || faceplate.textContent?.trim();
+        return number ? number.replace(/,/g, '') : null;
+    };
+    
+    // Read a metric from a container: faceplate-number first, then strong tag, then all text
+    const fromContainer = (container) => {
+        const faceplate = container.querySelector('faceplate-number');
+        if (faceplate) {
+            const value = fromFaceplate(faceplate);
+            if (value) {
+                return value;
+            }
+        }
+        const strongTag = container.querySelector('strong');
+        if (strongTag) {
+            const value = matchNumber(strongTag.textContent || strongTag.innerText);
+            if (value) {
+                return value;
+            }
+        }
+        return matchNumber(container.textContent || container.innerText);
+    };
+    
+    // Method 1: element with a specific slot name (r/automation, r/n8n, r/casino, etc.)
+    const fromSlot = (slot) => {
+        if (!slot) {
+            return null;
+        }
+        if (slot.tagName === 'FACEPLATE-NUMBER') {
+            return fromFaceplate(slot);
+        }
+        // Case 1: slot element has direct text (r/automation, r/n8n style)
+        const slotText = slot.textContent?.trim() || slot.innerText?.trim() || '';
+        if (slotText && /\\d/.test(slotText)) {
+            return matchNumber(slotText);
+        }
+        // Case 2: slot is empty, check the parent container (r/casino style)
+        const parentContainer = slot.closest(METRIC_DIV) || slot.parentElement;
+        return parentContainer ? fromContainer(parentContainer) : null;
+    };
+    
+    window.__rxMetrics = () => {
+        const bySlot = {};
+        const metricDivs = [];
+        for (const node of document.querySelectorAll(SELECTOR)) {
+            const slot = node.getAttribute('slot');
+            if (slot === VISITOR_SLOT || slot === CONTRIBUTOR_SLOT) {
+                bySlot[slot] = bySlot[slot] || node;
+            } else {
+                metricDivs.push(node);
+            }
+        }
+        
+        let visitors = fromSlot(bySlot[VISITOR_SLOT]);
+        let contributors = fromSlot(bySlot[CONTRIBUTOR_SLOT]);
+        
+        // Common case: slot elements gave both metrics, skip the fallback entirely
+        if (visitors && contributors) {
+            return [visitors, contributors];
+        }
+        
+        // Method 2: metric divs (fallback for subreddits without slot elements)
+        // First div = visitors, second div = contributors
+        if (metricDivs.length >= 2) {
+            visitors = visitors || fromContainer(metricDivs[0]);
+            contributors = contributors || fromContainer(metricDivs[1]);
+        }
+        
+        // Compact [visitors, contributors] pair keeps the CDP payload small
+        return [visitors, contributors];
+    };
+})();
+"""
+
+# Everything every page needs before its own scripts run
+_INIT_JS = _STEALTH_JS + _METRICS_JS
+
+# Resolves once any element _METRICS_JS reads is attached to the DOM: a slot element, or a bare
+# metric div (Method 2 also handles divs whose number is in a strong tag or plain text)
+_METRICS_READY_JS = """
+() => !!document.querySelector(
+    '[slot="%s"], [slot="%s"], div.flex.flex-col.items-start.flex-grow'
+)
+""" % (VISITOR_SLOT, CONTRIBUTOR_SLOT)
+
+# Resource types that are never needed to read the metrics
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+
+# Ad/analytics hosts and static assets that only add page weight
+BLOCKED_URL_PATTERNS = [
+    '**/*doubleclick.net/**',
+    '**/*google-analytics.com/**',
+    '**/*googletagmanager.com/**',
+    '**/*redditstatic.com/**/*.woff2',
+]
+
+
+async def _block_heavy_resources(route):
+    """Abort non-essential requests, let documents/scripts/xhr/fetch through"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _abort_route(route):
+    await route.abort()
+
+
+def result_source(result: Dict[str, Optional[str]]) -> str:
+    """Which path produced a result: 'json' (about.json counts) or 'browser' (weekly metrics)"""
+    return SOURCE_JSON if 'subscribers' in result else SOURCE_BROWSER
+
+
+def result_complete(result: Dict[str, Optional[str]]) -> bool:
+    """True when both metrics of the result's source were found"""
+    if result_source(result) == SOURCE_JSON:
+        return bool(result['subscribers'] and result['active_now'])
+    return bool(result['weekly_visitors'] and result['weekly_contributors'])
+
+
+class ResultCache:
+    """SQLite-backed cache of scraped results keyed by URL and source path, with a TTL"""
+    
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_CACHE_TTL):
+        self.ttl = ttl
+        self.conn = sqlite3.connect(path)
+        # Caches from before the source column existed can't tell metrics apart, drop them
+        columns = [row[1] for row in self.conn.execute('PRAGMA table_info(results)')]
+        if columns and 'source' not in columns:
+            self.conn.execute('DROP TABLE results')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'url TEXT, source TEXT, first TEXT, second TEXT, fetched_at REAL, '
+            'PRIMARY KEY (url, source))'
+        )
+        self.conn.commit()
+    
+    def get(self, url: str, sources: List[str]) -> Optional[Dict[str, Optional[str]]]:
+        """Return the cached result for url from the first of sources that has a fresh entry"""
+        for source in sources:
+            row = self.conn.execute(
+                'SELECT first, second FROM results WHERE url = ? AND source = ? AND fetched_at >= ?',
+                (url, source, time.time() - self.ttl)
+            ).fetchone()
+            if not row:
+                continue
+            if source == SOURCE_JSON:
+                return {'url': url, 'weekly_visitors': None, 'weekly_contributors': None,
+                        'subscribers': row[0], 'active_now': row[1]}
+            return {'url': url, 'weekly_visitors': row[0], 'weekly_contributors': row[1]}
+        return None
+    
+    def set(self, result: Dict[str, Optional[str]]):
+        """Store a result, replacing any previous entry for its URL and source"""
+        source = result_source(result)
+        if source == SOURCE_JSON:
+            values = (result['subscribers'], result['active_now'])
+        else:
+            values = (result['weekly_visitors'], result['weekly_contributors'])
+        self.conn.execute(
+            'INSERT OR REPLACE INTO results (url, source, first, second, fetched_at) VALUES (?, ?, ?, ?, ?)',
+            (result['url'], source, *values, time.time())
+        )
+        self.conn.commit()
+    
+    def close(self):
+        self.conn.close()
+
+
 class RedditScraper:
     """Scraper for Reddit subreddit metrics using Playwright"""
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, concurrency: int = DEFAULT_CONCURRENCY, use_json_api: bool = False,
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH, refresh: bool = False,
+                 cdp_endpoint: Optional[str] = None, client_id: Optional[str] = None,
+                 client_secret: Optional[str] = None):
         self.headless = headless
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.oauth_token = None
+        self.cdp_endpoint = cdp_endpoint
+        self.use_json_api = use_json_api
+        self.concurrency = max(1, concurrency)
+        self.cache_path = cache_path  # None disables caching
+        self.refresh = refresh  # Ignore cached entries but still update them
         self.results = []
         
-    async def setup_browser(self):
-        """Setup browser with stealth configuration"""
+    async def launch_browser(self):
+        """Launch the shared Chromium instance, or attach to a running one over CDP"""
         playwright = await async_playwright().start()
         
-        browser = await playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--no-sandbox',
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--disable-extensions',
-                '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            ]
-        )
+        if self.cdp_endpoint:
+            # Reuse an already running Chromium (see launch_shared_chromium.py) to skip the cold start.
+            # Closing a connected browser only drops our contexts and disconnects.
+            browser = await playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+        else:
+            browser = await playwright.chromium.launch(headless=self.headless, args=BROWSER_ARGS)
         
+        return playwright, browser
+    
+    async def make_context(self, browser):
+        """Create an isolated browser context with stealth configuration"""
         context = await browser.new_context(
             viewport={'width': 1536, 'height': 816},  # Match browser tool window size
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            user_agent=USER_AGENT,
             locale='en-US',
             timezone_id='America/New_York',
             extra_http_headers={
@@ -38,26 +363,32 @@ class RedditScraper:
             }
         )
         
-        # Add stealth scripts
-        await context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined,
-            });
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5],
-            });
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en'],
-            });
-            window.chrome = {
-                runtime: {},
-                loadTimes: function() {},
-                csi: function() {},
-                app: {}
-            };
-        """)
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+        
+        # Stealth overrides and the metric extractor, registered as a single init script
+        await context.add_init_script(_INIT_JS)
         
-        return playwright, browser, context
+        # Block images, fonts, media and trackers (scripts stay so the metric components render).
+        # Playwright runs the most recently registered matching route first, so the catch-all goes in first.
+        await context.route("**/*", _block_heavy_resources)
+        for pattern in BLOCKED_URL_PATTERNS:
+            await context.route(pattern, _abort_route)
+        
+        return context
+    
+    def retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait after a 429: Retry-After if given, else exponential backoff with jitter (capped)"""
+        delay = BACKOFF_BASE_S * (2 ** attempt) + random.uniform(0, MAX_JITTER_S)
+        if retry_after:
+            try:
+                delay = max(0.0, float(retry_after))
+            except ValueError:
+                pass  # HTTP-date form, use backoff instead
+        return min(delay, MAX_RETRY_DELAY_S)
+    
+    async def throttle(self):
+        """Small random delay so concurrent workers don't hit Reddit in lockstep"""
+        await asyncio.sleep(random.uniform(0, MAX_JITTER_S))
     
     def parse_number(self, text: str) -> Optional[str]:
         """Parse number from text (handles K, M suffixes)"""
@@ -68,27 +399,54 @@ class RedditScraper:
         text = text.strip().upper()
         
         # Extract number and suffix
-        match = re.search(r'([\d.]+)\s*([KM]?)', text)
+        match = _NUM_RE.search(text)
         if match:
-            number = match.group(1)
+            number = match.group(1).replace(',', '')
             suffix = match.group(2)
             return f"{number}{suffix}" if suffix else number
         
         # Try to extract just numbers
-        numbers = re.findall(r'[\d.]+', text)
+        numbers = _NUM_ANY.search(text)
         if numbers:
-            return numbers[0]
+            return numbers.group(0).replace(',', '')
         
         return None
     
-    def find_metric_value(self, text: str, keywords: List[str]) -> Optional[str]:
-        """Find metric value that matches any of the keywords"""
-        text_lower = text.lower()
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                # Try to extract the number
-                return self.parse_number(text)
-        return None
+    def parse_ssr_metrics(self, html: str) -> Tuple[Optional[str], Optional[str]]:
+        """Read (visitors, contributors) from server-rendered faceplate-number markup, without rendering"""
+        if HTMLParser is None:
+            return None, None
+        
+        tree = HTMLParser(html)
+        values = []
+        for slot in (VISITOR_SLOT, CONTRIBUTOR_SLOT):
+            value = None
+            node = tree.css_first(f'[slot="{slot}"]')
+            if node is not None and node.tag != 'faceplate-number':
+                node = node.css_first('faceplate-number')
+            if node is not None:
+                number = node.attributes.get('number') or node.text(strip=True)
+                if number and _NUM_ANY.search(number):
+                    value = number.replace(',', '')
+            values.append(value)
+        return values[0], values[1]
+    
+    def find_metric_value(self, text: str, keyword_re: Pattern) -> Optional[str]:
+        """Find metric value next to the first keyword matched by the compiled keyword pattern"""
+        # One scan over the body text for all keywords of this metric
+        match = keyword_re.search(text)
+        if not match:
+            return None
+        
+        # Only look at a short window around the label instead of re-parsing the whole body.
+        # Reddit renders the number right before its label ("170K Weekly visitors 2.7K Weekly
+        # contributors"), so the nearest preceding number wins; the number after the label
+        # usually belongs to the next metric and is only a fallback
+        before = _NUM_RE.findall(text[max(0, match.start() - KEYWORD_WINDOW):match.start()].upper())
+        if before:
+            number, suffix = before[-1]
+            return f"{number.replace(',', '')}{suffix}"
+        return self.parse_number(text[match.end():match.end() + KEYWORD_WINDOW])
     
     async def scrape_subreddit(self, url: str, page) -> Dict[str, Optional[str]]:
         """Scrape metrics from a single subreddit using the provided page"""
@@ -99,218 +457,61 @@ class RedditScraper:
         }
         
         try:
-            # Navigate to the subreddit (pages load quickly)
-            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            # Navigate to the subreddit, returning as soon as the response starts
+            for attempt in range(MAX_RETRIES + 1):
+                response = None
+                try:
+                    response = await page.goto(url, wait_until='commit')
+                except PlaywrightTimeoutError:
+                    pass  # Navigation never committed, handled below
+                if not response or response.status != 429 or attempt == MAX_RETRIES:
+                    break
+                # Rate limited: back off instead of hammering Reddit
+                await asyncio.sleep(self.retry_delay(attempt, response.headers.get('retry-after')))
+            
+            # The page is reused across URLs, so if this navigation didn't commit (or failed)
+            # it may still show the previous subreddit; extracting now would record its numbers here
+            if not response or not response.ok:
+                return result
             
-            # Wait for the metric divs or slot elements to appear (pages load quickly)
+            # Server-rendered markup often already has the numbers; parse it without waiting for rendering.
+            # The body download is bounded like the metric wait so a slow response can't stall the worker
             try:
-                await page.wait_for_selector('div.flex.flex-col.items-start.flex-grow, [slot="weekly-active-users-count"]', timeout=10000)
-            except:
-                # If selectors don't appear, short wait for React to render
-                await page.wait_for_timeout(1000)
+                html = await asyncio.wait_for(response.text(), METRICS_WAIT_TIMEOUT_MS / 1000)
+                visitors, contributors = self.parse_ssr_metrics(html)
+                if visitors and contributors:
+                    result['weekly_visitors'] = visitors
+                    result['weekly_contributors'] = contributors
+                    return result
+            except Exception:
+                pass  # Timed out or unparsable, fall through to the rendered page
             
-            # Brief wait for any dynamic content
-            await page.wait_for_timeout(500)
+            # Wait until an element the extractor reads is present instead of sleeping
+            try:
+                await page.wait_for_function(_METRICS_READY_JS, timeout=METRICS_WAIT_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                pass  # Extract whatever has rendered so far
             
-            # Use JavaScript evaluation to find metrics based on the actual Reddit structure
-            # Reddit uses slot names: weekly-active-users-count and weekly-contributions-count
+            # Run the extractor pre-installed by make_context (see _METRICS_JS)
             try:
-                metrics = await page.evaluate("""
-                    () => {
-                        const results = { visitors: null, contributors: null };
-                        
-                        // Method 1: Look for elements with specific slot names (works for r/automation, r/n8n, r/casino, etc.)
-                        // This is the most reliable method as it targets the exact slot names
-                        // Weekly active users count (visitors)
-                        const visitorSlot = document.querySelector('[slot="weekly-active-users-count"]');
-                        if (visitorSlot && !results.visitors) {
-                            // Case 1: Slot element has direct text (r/automation, r/n8n style)
-                            const slotText = visitorSlot.textContent?.trim() || visitorSlot.innerText?.trim() || '';
-                            if (slotText && /\\d/.test(slotText)) {
-                                const visitorMatch = slotText.match(/(\\d+(?:[.,]\\d+)?[KM]?)/);
-                                if (visitorMatch) {
-                                    results.visitors = visitorMatch[1].replace(/,/g, '');
-                                }
-                            } else {
-                                // Case 2: Slot is empty, check parent container for faceplate-number or strong tag (r/casino style)
-                                const parentContainer = visitorSlot.closest('div.flex.flex-col.items-start.flex-grow') || 
-                                                       visitorSlot.parentElement;
-                                if (parentContainer) {
-                                    const visitorFaceplate = parentContainer.querySelector('faceplate-number');
-                                    if (visitorFaceplate) {
-                                        const number = visitorFaceplate.textContent?.trim() || visitorFaceplate.getAttribute('number');
-                                        if (number) {
-                                            results.visitors = number.replace(/,/g, '');
-                                        }
-                                    } else {
-                                        const strongTag = parentContainer.querySelector('strong');
-                                        if (strongTag) {
-                                            const visitorText = strongTag.textContent || strongTag.innerText || '';
-                                            const visitorMatch = visitorText.match(/(\\d+(?:[.,]\\d+)?[KM]?)/);
-                                            if (visitorMatch) {
-                                                results.visitors = visitorMatch[1].replace(/,/g, '');
-                                            }
-                                        } else {
-                                            const visitorText = parentContainer.textContent || parentContainer.innerText || '';
-                                            const visitorMatch = visitorText.match(/(\\d+(?:[.,]\\d+)?[KM]?)/);
-                                            if (visitorMatch) {
-                                                results.visitors = visitorMatch[1].replace(/,/g, '');
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                        
-                        // Weekly contributions count (contributors)
-                        const contributorSlot = document.querySelector('[slot="weekly-contributions-count"]');
-                        if (contributorSlot && !results.contributors) {
-                            // Case 1: Slot element has direct text (r/automation, r/n8n style)
-                            const slotText = contributorSlot.textContent?.trim() || contributorSlot.innerText?.trim() || '';
-                            if (slotText && /\\d/.test(slotText)) {
-                                const contributorMatch = slotText.match(/(\\d+(?:[.,]\\d+)?[KM]?)/);
-                                if (contributorMatch) {
-                                    results.contributors = contributorMatch[1].replace(/,/g, '');
-                                }
-                            } else {
-                                // Case 2: Slot is empty, check parent container for faceplate-number or strong tag (r/casino style)
-                                const parentContainer = contributorSlot.closest('div.flex.flex-col.items-start.flex-grow') || 
-                                                       contributorSlot.parentElement;
-                                if (parentContainer) {
-                                    const contributorFaceplate = parentContainer.querySelector('faceplate-number');
-                                    if (contributorFaceplate) {
-                                        const number = contributorFaceplate.textContent?.trim() || contributorFaceplate.getAttribute('number');
-                                        if (number) {
-                                            results.contributors = number.replace(/,/g, '');
-                                        }
-                                    } else {
-                                        const strongTag = parentContainer.querySelector('strong');
-                                        if (strongTag) {
-                                            const contributorText = strongTag.textContent || strongTag.innerText || '';
-                                            const contributorMatch = contributorText.match(/(\\d+(?:[.,]\\d+)?[KM]?)/);
-                                            if (contributorMatch) {
-                                                results.contributors = contributorMatch[1].replace(/,/g, '');
-                                            }
-                                        } else {
-                                            const contributorText = parentContainer.textContent || parentContainer.innerText || '';
-                                            const contributorMatch = contributorText.match(/(\\d+(?:[.,]\\d+)?[KM]?)/);
-                                            if (contributorMatch) {
-                                                results.contributors = contributorMatch[1].replace(/,/g, '');
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                        
-                        // Method 2: Look for the div structure (fallback for subreddits without slot elements)
-                        // Find divs with class "flex flex-col items-start flex-grow"
-                        // First div = visitors, second div = contributors
-                        const metricDivs = Array.from(document.querySelectorAll('div.flex.flex-col.items-start.flex-grow'));
-                        if (metricDivs.length >= 2) {
-                            // First div contains visitors
-                            if (!results.visitors && metricDivs[0]) {
-                                // Try to find faceplate-number first (most reliable)
-                                const visitorFaceplate = metricDivs[0].querySelector('faceplate-number');
-                                if (visitorFaceplate) {
-                                    const number = visitorFaceplate.textContent?.trim() || visitorFaceplate.getAttribute('number');
-                                    if (number) {
-                                        results.visitors = number.replace(/,/g, '');
-                                    }
-                                }
-                                
-                                // If no faceplate-number, try to extract from strong tag or text content
-                                if (!results.visitors) {
-                                    const strongTag = metricDivs[0].querySelector('strong');
-                                    if (strongTag) {
-                                        const visitorText = strongTag.textContent || strongTag.innerText || '';
-                                        const visitorMatch = visitorText.match(/(\\d+(?:[.,]\\d+)?[KM]?)/);
-                                        if (visitorMatch) {
-                                            results.visitors = visitorMatch[1].replace(/,/g, '');
-                                        }
-                                    }
-                                }
-                                
-                                // Fallback: extract from entire div text
-                                if (!results.visitors) {
-                                    const visitorText = metricDivs[0].textContent || metricDivs[0].innerText || '';
-                                    const visitorMatch = visitorText.match(/(\\d+(?:[.,]\\d+)?[KM]?)/);
-                                    if (visitorMatch) {
-                                        results.visitors = visitorMatch[1].replace(/,/g, '');
-                                    }
-                                }
-                            }
-                            
-                            // Second div contains contributors
-                            if (!results.contributors && metricDivs[1]) {
-                                // Try to find faceplate-number first (most reliable)
-                                const contributorFaceplate = metricDivs[1].querySelector('faceplate-number');
-                                if (contributorFaceplate) {
-                                    const number = contributorFaceplate.textContent?.trim() || contributorFaceplate.getAttribute('number');
-                                    if (number) {
-                                        results.contributors = number.replace(/,/g, '');
-                                    }
-                                }
-                                
-                                // If no faceplate-number, try to extract from strong tag or text content
-                                if (!results.contributors) {
-                                    const strongTag = metricDivs[1].querySelector('strong');
-                                    if (strongTag) {
-                                        const contributorText = strongTag.textContent || strongTag.innerText || '';
-                                        const contributorMatch = contributorText.match(/(\\d+(?:[.,]\\d+)?[KM]?)/);
-                                        if (contributorMatch) {
-                                            results.contributors = contributorMatch[1].replace(/,/g, '');
-                                        }
-                                    }
-                                }
-                                
-                                // Fallback: extract from entire div text
-                                if (!results.contributors) {
-                                    const contributorText = metricDivs[1].textContent || metricDivs[1].innerText || '';
-                                    const contributorMatch = contributorText.match(/(\\d+(?:[.,]\\d+)?[KM]?)/);
-                                    if (contributorMatch) {
-                                        results.contributors = contributorMatch[1].replace(/,/g, '');
-                                    }
-                                }
-                            }
-                        }
-                        
-                        
-                        return results;
-                    }
-                """)
-                
-                if metrics.get('visitors'):
-                    result['weekly_visitors'] = metrics['visitors']
-                if metrics.get('contributors'):
-                    result['weekly_contributors'] = metrics['contributors']
+                visitors, contributors = await page.evaluate("() => window.__rxMetrics()")
+                result['weekly_visitors'] = visitors or None
+                result['weekly_contributors'] = contributors or None
                     
             except Exception as e:
                 # Fallback: try text-based search
                 try:
                     body_text = await page.evaluate("() => document.body.textContent || ''")
                     
-                    # Keywords for weekly visitors (members, subscribers, gamblers, etc.)
-                    visitor_keywords = [
-                        'weekly visitors', 'visitors', 'members', 'subscribers', 
-                        'gamblers', 'users', 'community members', 'joined'
-                    ]
-                    
-                    # Keywords for weekly contributors (active, here now, online, contributors, etc.)
-                    contributor_keywords = [
-                        'weekly contributors', 'contributors', 'here now', 'online',
-                        'active', 'active users', 'currently online', 'online now'
-                    ]
-                    
                     # Look for visitor metric
                     if not result['weekly_visitors']:
-                        visitor_value = self.find_metric_value(body_text, visitor_keywords)
+                        visitor_value = self.find_metric_value(body_text, _VISITOR_KW_RE)
                         if visitor_value:
                             result['weekly_visitors'] = visitor_value
                     
                     # Look for contributor metric
                     if not result['weekly_contributors']:
-                        contributor_value = self.find_metric_value(body_text, contributor_keywords)
+                        contributor_value = self.find_metric_value(body_text, _CONTRIBUTOR_KW_RE)
                         if contributor_value:
                             result['weekly_contributors'] = contributor_value
                 except:
@@ -324,61 +525,264 @@ class RedditScraper:
         
         return result
     
+    async def fetch_oauth_token(self) -> Optional[str]:
+        """Get an app-only OAuth token with the client_credentials grant (None if unavailable)"""
+        if not (self.client_id and self.client_secret):
+            return None
+        try:
+            async with httpx.AsyncClient(headers={'User-Agent': OAUTH_USER_AGENT}, timeout=15) as client:
+                response = await client.post(OAUTH_TOKEN_URL, auth=(self.client_id, self.client_secret),
+                                             data={'grant_type': 'client_credentials'})
+                response.raise_for_status()
+                return response.json().get('access_token')
+        except (httpx.HTTPError, ValueError, AttributeError) as e:
+            print(f"Warning: Reddit OAuth failed ({e}), using the public about.json endpoint")
+            return None
+    
+    def make_json_client(self) -> httpx.AsyncClient:
+        """HTTP client for the JSON fast path, authenticated when an OAuth token is available"""
+        if self.oauth_token:
+            headers = {'User-Agent': OAUTH_USER_AGENT, 'Authorization': f'Bearer {self.oauth_token}'}
+        else:
+            headers = {'User-Agent': USER_AGENT}
+        return httpx.AsyncClient(headers=headers, follow_redirects=True, timeout=15)
+    
+    def about_url(self, url: str) -> str:
+        """URL of the subreddit's about endpoint (OAuth API when authenticated)"""
+        if self.oauth_token:
+            return f"{OAUTH_API_BASE}{urlsplit(url).path.rstrip('/')}/about"
+        return f"{url.split('?')[0].rstrip('/')}/about.json"
+    
+    async def scrape_about_json(self, url: str, client: httpx.AsyncClient) -> Optional[Dict[str, Optional[str]]]:
+        """Fetch subscriber and online-now counts from the subreddit's about endpoint (no browser needed).
+        
+        These are not the weekly metrics shown on the page, so they go into the subscribers/active_now fields.
+        Returns None when the endpoint is blocked or lacks either count, so the caller can fall back to Playwright.
+        """
+        about_url = self.about_url(url)
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                response = await client.get(about_url)
+                if response.status_code != 429 or attempt == MAX_RETRIES:
+                    break
+                await asyncio.sleep(self.retry_delay(attempt, response.headers.get('retry-after')))
+            if response.status_code != 200:
+                return None
+            data = _json_loads(response.content).get('data') or {}
+        except (httpx.HTTPError, ValueError, AttributeError):
+            return None
+        
+        subscribers = data.get('subscribers')
+        # Reddit often sends accounts_active as null; 0 is a real value and must not fall back
+        active_now = data.get('accounts_active')
+        if active_now is None:
+            active_now = data.get('active_user_count')
+        if subscribers is None or active_now is None:
+            return None
+        
+        return {
+            'url': url,
+            'weekly_visitors': None,
+            'weekly_contributors': None,
+            'subscribers': str(subscribers),
+            'active_now': str(active_now)
+        }
+    
     async def scrape_subreddits(self, urls: List[str], output_file: str = None, csv_file: str = None) -> List[Dict]:
-        """Scrape multiple subreddits using the same browser/page continuously"""
-        playwright, browser, context = await self.setup_browser()
+        """Scrape multiple subreddits with Playwright, or via the about.json endpoint first when enabled"""
         results = []
-        page = None
+        by_url = {}
+        
+        # Stream each result as it completes: one JSON line and one CSV row, never rewriting the file
+        jsonl_f = open(self.jsonl_path(output_file), 'wb') if output_file else None
+        csv_f = open(csv_file, 'w', newline='', encoding='utf-8') if csv_file else None
+        csv_w = None
+        if csv_f:
+            csv_w = csv.DictWriter(csv_f, fieldnames=JSON_API_FIELDNAMES if self.use_json_api else FIELDNAMES)
+            csv_w.writeheader()
+        
+        cache = ResultCache(self.cache_path) if self.cache_path else None
+        
+        def record(result: Dict[str, Optional[str]], cached: bool = False):
+            # Print result
+            print(f"Done: {result['url']}" + (" (cached)" if cached else ""))
+            if 'subscribers' in result:
+                print(f"  Subscribers: {result['subscribers']}")
+                print(f"  Active now: {result['active_now']}")
+            else:
+                print(f"  Visitors: {result['weekly_visitors'] or 'Not found'}")
+                print(f"  Contributors: {result['weekly_contributors'] or 'Not found'}")
+            print()
+            
+            by_url[result['url']] = result
+            results.append(result)
+            
+            # Only remember complete results, so a missing metric is retried next run
+            if cache and not cached and result_complete(result):
+                cache.set(result)
+            
+            # Incremental saving
+            if jsonl_f:
+                jsonl_f.write(_json_dumps(result) + b'\n')
+                jsonl_f.flush()
+            if csv_w:
+                csv_w.writerow(result)
+                csv_f.flush()
         
         try:
-            # Create a single page to reuse for all URLs
-            page = await context.new_page()
+            # Cached results skip all network work
+            if cache and not self.refresh:
+                # Browser results are valid in both modes; about.json results only when that path is enabled
+                sources = [SOURCE_JSON, SOURCE_BROWSER] if self.use_json_api else [SOURCE_BROWSER]
+                for url in urls:
+                    cached_result = cache.get(url, sources)
+                    if cached_result and url not in by_url:
+                        record(cached_result, cached=True)
+            remaining = [url for url in urls if url not in by_url]
             
-            for url in urls:
-                print(f"Scraping: {url}")
-                result = await self.scrape_subreddit(url, page)
-                results.append(result)
+            # Opt-in fast path: a single HTTP round-trip per subreddit
+            if self.use_json_api and remaining:
+                sem = asyncio.Semaphore(self.concurrency)
                 
-                # Print result
-                print(f"  Visitors: {result['weekly_visitors'] or 'Not found'}")
-                print(f"  Contributors: {result['weekly_contributors'] or 'Not found'}")
-                print()
+                async def json_worker(url: str, client: httpx.AsyncClient):
+                    async with sem:
+                        await self.throttle()
+                        result = await self.scrape_about_json(url, client)
+                    if result:
+                        record(result)
                 
-                # Save results after each URL (incremental saving)
-                if output_file:
-                    self.save_results(results, output_file)
-                if csv_file:
-                    self.save_results_csv(results, csv_file)
+                if self.oauth_token is None:
+                    self.oauth_token = await self.fetch_oauth_token()
                 
-                # Small delay between requests
-                await asyncio.sleep(1)
-        
+                async with self.make_json_client() as client:
+                    await asyncio.gather(*(json_worker(url, client) for url in remaining))
+                remaining = [url for url in urls if url not in by_url]
+            
+            # Slow path: render the pages that the JSON endpoint could not serve
+            if remaining:
+                await self._scrape_with_browser(remaining, record)
         finally:
-            # Close page and browser only at the end
-            if page:
+            if cache:
+                cache.close()
+            if jsonl_f:
+                jsonl_f.close()
+            if csv_f:
+                csv_f.close()
+            # Aggregate JSON is written once, in input order
+            if output_file:
+                self.finalize([by_url[url] for url in urls if url in by_url], output_file)
+        
+        return [by_url[url] for url in urls if url in by_url]
+    
+    async def _scrape_with_browser(self, urls: List[str], record):
+        """Scrape URLs with Playwright: one worker per context, each navigating a single long-lived page"""
+        playwright, browser = await self.launch_browser()
+        contexts = []
+        
+        # Workers pull from a shared queue, so each one loops through its share of URLs
+        url_queue = asyncio.Queue()
+        for url in urls:
+            url_queue.put_nowait(url)
+        
+        async def close_quietly(page):
+            try:
                 await page.close()
+            except Exception:
+                pass  # Page or renderer already gone
+        
+        async def worker(context):
+            page = None
+            uses = 0
+            try:
+                while not url_queue.empty():
+                    url = url_queue.get_nowait()
+                    try:
+                        # Open the page on first use and after a failure, and recycle it now and
+                        # then so long-lived renderer state can't pile up
+                        if page is None or uses >= PAGE_RECYCLE_EVERY:
+                            if page is not None:
+                                await close_quietly(page)
+                                page = None
+                            page = await context.new_page()
+                            uses = 0
+                        
+                        await self.throttle()
+                        print(f"Scraping: {url}")
+                        result = await self.scrape_subreddit(url, page)
+                        uses += 1
+                        
+                        # Stop anything still loading before the page navigates to the next URL
+                        try:
+                            await page.evaluate("() => { window.stop(); }")
+                        except Exception:
+                            pass
+                    except Exception as e:
+                        # e.g. a renderer crash: record this URL as not found and start over with a fresh page
+                        print(f"  Error scraping {url}: {e}")
+                        result = {'url': url, 'weekly_visitors': None, 'weekly_contributors': None}
+                        if page is not None:
+                            await close_quietly(page)
+                            page = None
+                    
+                    record(result)
+            finally:
+                if page is not None:
+                    await close_quietly(page)
+        
+        try:
+            # One context per worker, created up front and reused for all of its URLs
+            for _ in range(min(self.concurrency, len(urls))):
+                contexts.append(await self.make_context(browser))
+            
+            # Let every worker finish draining the queue before contexts are torn down,
+            # then surface the first unexpected failure
+            outcomes = await asyncio.gather(*(worker(context) for context in contexts), return_exceptions=True)
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+        finally:
+            for context in contexts:
+                await context.close()
             await browser.close()
             await playwright.stop()
-        
-        return results
+    
+    def jsonl_path(self, output_file: str) -> str:
+        """Path of the JSON-Lines file streamed next to the aggregate JSON output (never the output itself)"""
+        path = os.path.splitext(output_file)[0] + '.jsonl'
+        if os.path.abspath(path) == os.path.abspath(output_file):
+            # e.g. --output results.jsonl: finalize() would overwrite the stream
+            path = os.path.splitext(output_file)[0] + '.stream.jsonl'
+        return path
+    
+    def finalize(self, results: List[Dict], output_file: str):
+        """Write the aggregate JSON once at the end of a run"""
+        self.save_results(results, output_file)
+        print(f"Streamed results saved to {self.jsonl_path(output_file)}")
     
     def save_results(self, results: List[Dict], output_file: str = 'reddit_results.json'):
-        """Save results to JSON file (overwrites file each time)"""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
-        # Don't print every time to avoid spam, only print on final save
-    
-    def save_results_csv(self, results: List[Dict], output_file: str = 'reddit_results.csv'):
-        """Save results to CSV file (overwrites file each time)"""
-        if not results:
-            return
-        
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=['url', 'weekly_visitors', 'weekly_contributors'])
-            writer.writeheader()
-            for result in results:
-                writer.writerow(result)
-        # Don't print every time to avoid spam, only print on final save
+        """Save results to JSON file (overwrites the file)"""
+        with open(output_file, 'wb') as f:
+            f.write(_json_dumps(results, indent=True))
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a subreddit URL: lowercase, no query string, exactly one trailing slash"""
+    return re.sub(r'/+$', '', url.strip().lower().split('?')[0]) + '/'
+
+
+def dedupe_urls(urls: List[str]) -> List[str]:
+    """Canonicalize URLs and drop duplicates (and non-string entries), keeping first-seen order"""
+    canonical = {}
+    for url in urls:
+        # JSON input files may contain objects or numbers; they can't be URLs
+        if not isinstance(url, str):
+            print(f"Warning: skipping non-string URL entry {url!r}")
+            continue
+        canonical_url = canonicalize_url(url)
+        if canonical_url != url.strip():
+            print(f"Warning: {url.strip()} -> {canonical_url}")
+        canonical.setdefault(canonical_url, None)
+    return list(canonical)
 
 
 async def main():
@@ -390,6 +794,21 @@ async def main():
     parser.add_argument('--file', type=str, help='File containing URLs (one per line or JSON array)')
     parser.add_argument('--output', type=str, default='reddit_results.json', help='Output file path')
     parser.add_argument('--csv', type=str, help='Also save as CSV with this filename')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Number of pages scraped in parallel (default: $SCRAPE_CONCURRENCY or 8)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Ignore cached results and scrape every URL again')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Disable the on-disk result cache ({DEFAULT_CACHE_PATH})')
+    parser.add_argument('--cdp-endpoint', type=str,
+                        help='Connect to an already running Chromium (e.g. http://localhost:9222) instead of launching one')
+    parser.add_argument('--client-id', type=str, default=os.environ.get('REDDIT_CLIENT_ID'),
+                        help='Reddit app client ID for authenticated API access (default: $REDDIT_CLIENT_ID)')
+    parser.add_argument('--client-secret', type=str, default=os.environ.get('REDDIT_CLIENT_SECRET'),
+                        help='Reddit app client secret (default: $REDDIT_CLIENT_SECRET)')
+    parser.add_argument('--json-api', dest='use_json_api', action='store_true',
+                        help='Fetch subscriber/online-now counts from about.json first (different metrics than the '
+                             'weekly ones); only subreddits where that fails are rendered with Playwright')
     
     # Browser mode options (default: headless)
     browser_mode = parser.add_mutually_exclusive_group()
@@ -411,26 +830,33 @@ async def main():
     elif args.file:
         with open(args.file, 'r', encoding='utf-8') as f:
             content = f.read().strip()
-            # Try JSON first
-            try:
-                data = json.loads(content)
-                if isinstance(data, list):
-                    urls = data
-                else:
-                    urls = [data]
-            except:
-                # Otherwise treat as line-separated URLs
-                urls = [line.strip() for line in content.split('\n') if line.strip()]
+        # Sniff the format instead of attempting a JSON parse on every line-based file
+        if content[:1] in ('[', '{', '"'):
+            data = _json_loads(content)
+            if isinstance(data, list):
+                urls = data
+            else:
+                urls = [data]
+        else:
+            # Otherwise treat as line-separated URLs
+            urls = [line.strip() for line in content.splitlines() if line.strip()]
     else:
         # Default: use example URL
         urls = ['https://www.reddit.com/r/gambling/']
     
+    # Every duplicate costs a full page load, so normalize and dedupe up front
+    urls = dedupe_urls(urls)
+    
     if not urls:
         print("No URLs provided. Use --urls or --file to specify subreddit URLs.")
         return
     
     # Create scraper and run
-    scraper = RedditScraper(headless=args.headless)
+    scraper = RedditScraper(headless=args.headless, concurrency=args.concurrency,
+                            use_json_api=args.use_json_api, refresh=args.refresh,
+                            cache_path=None if args.no_cache else DEFAULT_CACHE_PATH,
+                            cdp_endpoint=args.cdp_endpoint, client_id=args.client_id,
+                            client_secret=args.client_secret)
     results = await scraper.scrape_subreddits(urls, output_file=args.output, csv_file=args.csv)
     
     # Print final save confirmation
@@ -442,4 +868,10 @@ async def main():
 
 
 if __name__ == '__main__':
+    # uvloop is optional: a faster event loop for many concurrent page/HTTP callbacks
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())